@@ -1,16 +1,28 @@
 # todo_projects_pyqt6.py
 # Run: python todo_projects_pyqt6.py
 # Requires: pip install PyQt6
+# Optional: pip install orjson  (faster project file load/save)
 
 from __future__ import annotations
 
 import os
 import sys
 import json
+import functools
+import itertools
 import random
+import re
+from collections import OrderedDict
 from pathlib import Path
 from dataclasses import dataclass, field
+from operator import attrgetter
 from datetime import date
+from html import escape
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
 
 # ------------------------------------------------------------
 # macOS: FORCE in-window menu bar (NOT the Apple top bar)
@@ -19,13 +31,21 @@ from datetime import date
 if sys.platform == "darwin":
     os.environ["QT_MAC_DISABLE_NATIVE_MENUBAR"] = "1"
 
-from PyQt6.QtCore import Qt, QDate, QEvent, pyqtSignal, QTimer
-from PyQt6.QtGui import QKeySequence, QTextDocument
+from PyQt6.QtCore import (
+    Qt, QDate, QEvent, QObject, QRunnable, QThreadPool, QMutex, QMutexLocker,
+    QFileSystemWatcher, QSaveFile, QIODevice,
+    QAbstractListModel, QModelIndex, QPoint, QRectF, QSize, pyqtSignal, pyqtSlot, QTimer
+)
+from PyQt6.QtGui import (
+    QKeySequence, QAction, QTextDocument, QPainter, QColor, QPalette,
+    QStandardItemModel, QStandardItem
+)
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QCheckBox, QScrollArea, QFrame,
     QStackedWidget, QInputDialog, QDialog, QDialogButtonBox,
-    QLineEdit, QDateEdit, QMessageBox, QFileDialog, QMenu
+    QLineEdit, QDateEdit, QMessageBox, QFileDialog, QMenu,
+    QListView, QAbstractItemView, QStyledItemDelegate, QStyleOptionViewItem
 )
 from PyQt6.QtPrintSupport import QPrinter
 
@@ -41,25 +61,167 @@ QUOTES = [
     "“Fuck it. Work harder.”",
 ]
 
+# shuffle once and cycle: no RNG per tick and no back-to-back repeats
+_shuffled_quotes = QUOTES.copy()
+random.shuffle(_shuffled_quotes)
+_quote_iter = itertools.cycle(_shuffled_quotes)
+
+# ============================================================
+# Styles (applied once, application-wide, in main())
+# ============================================================
+_PROJECT_CARD_QSS = """
+    QFrame#ProjectCard {
+        background-color: palette(window);
+        border: 1px solid palette(mid);
+        border-radius: 12px;
+        padding: 6px;
+    }
+    QFrame#ProjectCard:hover {
+        border-color: palette(highlight);
+    }
+    QFrame#ProjectCard[active="true"] {
+        background-color: palette(base);
+        border: 2px solid palette(highlight);
+    }
+"""
+
+# task rows are painted by TaskDelegate; the list itself should disappear into the card
+_TASK_LIST_QSS = """
+    QListView#TaskList {
+        background: transparent;
+        border: none;
+    }
+"""
+
+# palette(windowText) is white in dark mode, dark in light mode
+_QUOTE_QSS = """
+    QLabel#QuoteLabel {
+        color: palette(windowText);
+        font-style: italic;
+        padding: 4px;
+    }
+"""
+
+# installed once as the PDF export document's default stylesheet
+_PDF_CSS = """
+    body {
+        font-family: Helvetica, Arial, sans-serif;
+        font-size: 11pt;
+    }
+    h1 {
+        font-size: 14pt;
+        margin-bottom: 10px;
+    }
+    h2 {
+        font-size: 12pt;
+        margin-top: 18px;
+        margin-bottom: 6px;
+    }
+    ul {
+        list-style-type: none;
+        padding-left: 0;
+        margin-left: 0;
+    }
+    li {
+        margin-bottom: 6px;
+    }
+"""
+
 # ============================================================
 # Data model
 # ============================================================
+# sort sentinel: one past the last representable ordinal, so undated tasks go last
+_NO_DUE_ORDINAL = date.max.toordinal() + 1
+
+# "today" for new-task defaults; refreshed once a minute by MainWindow
+_today = QDate.currentDate()
+
+
+def refresh_today() -> None:
+    global _today
+    _today = QDate.currentDate()
+
+
 @dataclass
 class Task:
     title: str
     due_date: date | None = None
     completed: bool = False
 
+    # due-date ordinal used as the sort key (plain int compares, no tuples)
+    # and the ISO string shown in the UI and exports ("" when undated);
+    # both derived from due_date: change it through set_due_date()
+    _sort_key: int = field(init=False, repr=False, compare=False)
+    due_iso: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.set_due_date(self.due_date)
+
+    def set_due_date(self, value: date | None) -> None:
+        self.due_date = value
+        self._sort_key = value.toordinal() if value else _NO_DUE_ORDINAL
+        self.due_iso = _format_date(value) if value else ""
+
+    def to_dict(self) -> dict:
+        # due_date stays a date; dumps_json writes it as an ISO string
+        return {"title": self.title, "due_date": self.due_date, "completed": self.completed}
+
+
+# C-level key for sorting tasks by due date, undated last
+by_due_date = attrgetter("_sort_key")
+
 
 @dataclass
 class Project:
     name: str
     tasks: list[Task] = field(default_factory=list)
 
+    # sorted views cached between rebuilds; call invalidate() after any
+    # change to `tasks` or to a task's completed/due_date
+    _active_sorted: list[Task] = field(default_factory=list, init=False, repr=False, compare=False)
+    _completed_sorted: list[Task] = field(default_factory=list, init=False, repr=False, compare=False)
+    _dirty: bool = field(default=True, init=False, repr=False, compare=False)
+
+    def to_dict(self) -> dict:
+        return {"name": self.name, "tasks": [t.to_dict() for t in self.tasks]}
+
+    def invalidate(self) -> None:
+        self._dirty = True
+
+    def view(self, show_completed: bool) -> list[Task]:
+        """Tasks for one board, sorted by due date (undated last). Do not mutate."""
+        if self._dirty:
+            # one sort, then one partitioning pass (sort is stable, so both halves stay ordered)
+            active: list[Task] = []
+            done: list[Task] = []
+            for t in sorted(self.tasks, key=by_due_date):
+                (done if t.completed else active).append(t)
+            self._active_sorted = active
+            self._completed_sorted = done
+            self._dirty = False
+        return self._completed_sorted if show_completed else self._active_sorted
+
 
 class AppState:
     def __init__(self) -> None:
         self.projects: list[Project] = []
+        # name -> project index; keep in sync through the helpers below
+        self.by_name: dict[str, Project] = {}
+
+    def add_project(self, project: Project) -> None:
+        self.projects.append(project)
+        self.by_name[project.name] = project
+
+    def remove_project(self, name: str) -> Project | None:
+        p = self.by_name.pop(name, None)
+        if p is not None:
+            self.projects.remove(p)
+        return p
+
+    def rename_project(self, old: str, new: str) -> None:
+        p = self.by_name.pop(old)
+        p.name = new
+        self.by_name[new] = p
 
 
 # ============================================================
@@ -74,10 +236,84 @@ def resolve_user_path(p: Path) -> Path:
     return p.expanduser().resolve()
 
 
+# Many tasks share a due date (milestones), so memoize both directions.
+_parse_date = functools.lru_cache(maxsize=1024)(date.fromisoformat)
+_format_date = functools.lru_cache(maxsize=1024)(date.isoformat)
+
+
+def _json_default(obj):
+    if isinstance(obj, date):
+        return _format_date(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(obj) -> bytes:
+    """Encode to indented UTF-8 JSON; dates are written as ISO strings."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=_json_default).encode("utf-8")
+
+
+def loads_json(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_atomic(path: Path, payload: bytes) -> None:
+    """
+    Write through QSaveFile: Qt fills a sibling temp file and only renames it
+    over `path` on commit, so a crash or sync client never sees a
+    half-written project file and a failed write leaves the old one intact.
+    """
+    f = QSaveFile(str(path))
+    if not f.open(QIODevice.OpenModeFlag.WriteOnly):
+        raise OSError(f.errorString())
+    if f.write(payload) != len(payload):
+        f.cancelWriting()
+    if not f.commit():
+        raise OSError(f.errorString())
+
+
+class _SaveSignals(QObject):
+    failed = pyqtSignal()
+
+
+class _SaveJob(QRunnable):
+    """
+    Writes an already-serialized payload on a QThreadPool worker so disk
+    (or Dropbox/iCloud) latency never blocks the GUI thread.
+    """
+    _lock = QMutex()        # guards _latest; held only briefly
+    _write_lock = QMutex()  # serializes writes across workers
+    _latest: dict[str, int] = {}
+
+    def __init__(self, path: Path, payload: bytes, signals: _SaveSignals):
+        super().__init__()
+        self.path = path
+        self.payload = payload
+        self.signals = signals
+        with QMutexLocker(_SaveJob._lock):
+            self.generation = _SaveJob._latest.get(str(path), 0) + 1
+            _SaveJob._latest[str(path)] = self.generation
+
+    def run(self):
+        with QMutexLocker(_SaveJob._write_lock):
+            with QMutexLocker(_SaveJob._lock):
+                stale = _SaveJob._latest.get(str(self.path)) != self.generation
+            # a newer payload for this file was queued after us; let it win
+            if stale:
+                return
+            try:
+                write_atomic(self.path, self.payload)
+            except Exception:
+                self.signals.failed.emit()
+
+
 def load_config() -> dict:
     if CONFIG_FILE.exists():
         try:
-            return json.loads(CONFIG_FILE.read_text(encoding="utf-8"))
+            return loads_json(CONFIG_FILE.read_bytes())
         except Exception:
             pass
     return {}
@@ -85,42 +321,32 @@ def load_config() -> dict:
 
 def save_config(cfg: dict) -> None:
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    CONFIG_FILE.write_text(json.dumps(cfg, indent=2), encoding="utf-8")
+    CONFIG_FILE.write_bytes(dumps_json(cfg))
 
 
 def serialize_state(state: AppState) -> dict:
-    return {
-        "version": 1,
-        "projects": [
-            {
-                "name": p.name,
-                "tasks": [
-                    {
-                        "title": t.title,
-                        "due_date": t.due_date.isoformat() if t.due_date else None,
-                        "completed": bool(t.completed),
-                    }
-                    for t in p.tasks
-                ],
-            }
-            for p in state.projects
-        ],
-    }
+    return {"version": 1, "projects": [p.to_dict() for p in state.projects]}
 
 
 def deserialize_state(data: dict) -> AppState:
     state = AppState()
     for p in data.get("projects", []):
-        proj = Project(name=p.get("name", "Untitled"))
+        # names are the lookup key, so disambiguate duplicates from older files
+        base = name = p.get("name", "Untitled")
+        n = 2
+        while name in state.by_name:
+            name = f"{base} ({n})"
+            n += 1
+        proj = Project(name=name)
         for t in p.get("tasks", []):
             proj.tasks.append(
                 Task(
                     title=t.get("title", "").strip() or "Untitled Task",
-                    due_date=date.fromisoformat(t["due_date"]) if t.get("due_date") else None,
+                    due_date=_parse_date(t["due_date"]) if t.get("due_date") else None,
                     completed=bool(t.get("completed", False)),
                 )
             )
-        state.projects.append(proj)
+        state.add_project(proj)
     return state
 
 
@@ -144,6 +370,9 @@ def create_new_file(parent) -> Path | None:
     return resolve_user_path(Path(path)) if path else None
 
 
+_CONFLICT_RE = re.compile(r"conflict|duplicate", re.IGNORECASE)
+
+
 def conflict_candidates(folder: Path, basefile: Path) -> list[Path]:
     """
     Heuristic: detect common cloud 'conflicted copy' duplicates near the file.
@@ -153,29 +382,51 @@ def conflict_candidates(folder: Path, basefile: Path) -> list[Path]:
     try:
         for p in folder.glob("*.json"):
             s = p.name.lower()
-            if p == basefile:
-                continue
-            if name in s and ("conflict" in s or "conflicted copy" in s or "duplicate" in s):
+            # cheapest test first; the regex only runs on name matches
+            if name in s and p != basefile and _CONFLICT_RE.search(s):
                 out.append(p)
     except Exception:
         pass
     return out
 
+
+class _ConflictSignals(QObject):
+    found = pyqtSignal(object, list)  # basefile, hits
+
+
+class _ConflictScanJob(QRunnable):
+    """Runs conflict_candidates off the UI thread; cloud folders can be slow to list."""
+
+    def __init__(self, basefile: Path, signals: _ConflictSignals):
+        super().__init__()
+        self.basefile = basefile
+        self.signals = signals
+
+    def run(self):
+        self.signals.found.emit(self.basefile, conflict_candidates(self.basefile.parent, self.basefile))
+
 def export_todo_list(
     projects: list[Project],
     selected_names: list[str],
     include_completed: bool,
     path: Path
 ):
-    lines: list[str] = []
+    # encode straight into one buffer: no list of lines, no join, no re-encode
+    buf = bytearray()
+    ap = buf.extend
+
+    def line(s: str = ""):
+        ap(s.encode("utf-8"))
+        ap(b"\n")
 
     today = date.today().isoformat()
-    lines.append("ThesisTracker – To-Do List")
-    lines.append(f"Generated: {today}")
-    lines.append("")
+    line("ThesisTracker – To-Do List")
+    line(f"Generated: {today}")
+    line()
 
+    selected = set(selected_names)
     for p in projects:
-        if p.name not in selected_names:
+        if p.name not in selected:
             continue
 
         tasks = [
@@ -186,18 +437,18 @@ def export_todo_list(
         if not tasks:
             continue
 
-        lines.append("=" * 32)
-        lines.append(f"PROJECT: {p.name}")
-        lines.append("-" * 32)
+        line("=" * 32)
+        line(f"PROJECT: {p.name}")
+        line("-" * 32)
 
-        for t in sorted(tasks, key=lambda x: (x.due_date is None, x.due_date or date.max)):
+        for t in sorted(tasks, key=by_due_date):
             box = "[x]" if t.completed else "[ ]"
-            due = f"  Due: {t.due_date.isoformat()}" if t.due_date else ""
-            lines.append(f"{box} {t.title}{due}")
+            due = f"  Due: {t.due_iso}" if t.due_iso else ""
+            line(f"{box} {t.title}{due}")
 
-        lines.append("")
+        line()
 
-    path.write_text("\n".join(lines), encoding="utf-8")
+    path.write_bytes(buf)
 
 
 # ============================================================
@@ -205,68 +456,102 @@ def export_todo_list(
 # ============================================================
 
 class SelectProjectsDialog(QDialog):
-    def __init__(self, projects: list[Project], parent=None):
+    """
+    Checkable project list for exports, all projects checked by default.
+    Pass `completed_option=True` to also offer an "Include completed tasks" box.
+    """
+
+    def __init__(self, projects: list[Project], parent=None,
+                 title: str = "Select Projects to Export", completed_option: bool = False):
         super().__init__(parent)
-        self.setWindowTitle("Select Projects to Export")
+        self.setWindowTitle(title)
+        self._projects = list(projects)
 
         layout = QVBoxLayout(self)
-        self.checks = []
-
-        for p in projects:
-            cb = QCheckBox(p.name)
-            cb.setChecked(True)
-            self.checks.append((cb, p))
-            layout.addWidget(cb)
+        layout.addWidget(QLabel("Select projects to include:"))
 
-        buttons = QDialogButtonBox(
+        # one model + view instead of a QCheckBox per project; row i is self._projects[i]
+        self.model = QStandardItemModel(self)
+        for p in self._projects:
+            item = QStandardItem(p.name)
+            item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Checked)
+            self.model.appendRow(item)
+        self.model.itemChanged.connect(self._update_ok)
+
+        self.project_list = QListView()
+        self.project_list.setModel(self.model)
+        self.project_list.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.project_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.project_list.setUniformItemSizes(True)
+        layout.addWidget(self.project_list)
+
+        row = QHBoxLayout()
+        all_btn = QPushButton("Select All")
+        all_btn.clicked.connect(self.select_all)
+        none_btn = QPushButton("Select None")
+        none_btn.clicked.connect(self.select_none)
+        row.addWidget(all_btn)
+        row.addWidget(none_btn)
+        row.addStretch()
+        layout.addLayout(row)
+
+        self.include_completed: QCheckBox | None = None
+        if completed_option:
+            self.include_completed = QCheckBox("Include completed tasks")
+            layout.addWidget(self.include_completed)
+
+        self.buttons = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok |
             QDialogButtonBox.StandardButton.Cancel
         )
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons)
-
-    def selected_projects(self) -> list[Project]:
-        return [p for cb, p in self.checks if cb.isChecked()]
-
-class ExportProjectsDialog(QDialog):
-    def __init__(self, projects: list[Project], parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Export To-Do List")
+        self.buttons.accepted.connect(self.accept)
+        self.buttons.rejected.connect(self.reject)
+        layout.addWidget(self.buttons)
 
-        layout = QVBoxLayout(self)
+    def _set_all(self, state: Qt.CheckState):
+        n = self.model.rowCount()
+        if not n:
+            return
+        # flip every row silently, then tell the view once
+        self.model.blockSignals(True)
+        try:
+            for r in range(n):
+                self.model.item(r).setCheckState(state)
+        finally:
+            self.model.blockSignals(False)
+        self.model.dataChanged.emit(
+            self.model.index(0, 0), self.model.index(n - 1, 0), [Qt.ItemDataRole.CheckStateRole.value]
+        )
+        self._update_ok()
 
-        layout.addWidget(QLabel("Select projects to include:"))
+    @pyqtSlot()
+    def select_all(self):
+        self._set_all(Qt.CheckState.Checked)
 
-        self.checkboxes: dict[str, QCheckBox] = {}
-        for p in projects:
-            cb = QCheckBox(p.name)
-            cb.setChecked(True)
-            self.checkboxes[p.name] = cb
-            layout.addWidget(cb)
+    @pyqtSlot()
+    def select_none(self):
+        self._set_all(Qt.CheckState.Unchecked)
 
-        self.include_completed = QCheckBox("Include completed tasks")
-        self.include_completed.setChecked(False)
-        layout.addWidget(self.include_completed)
+    @pyqtSlot()
+    def _update_ok(self):
+        # nothing to export with no project checked
+        ok = self.buttons.button(QDialogButtonBox.StandardButton.Ok)
+        ok.setEnabled(any(
+            self.model.item(r).checkState() == Qt.CheckState.Checked
+            for r in range(self.model.rowCount())
+        ))
 
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok |
-            QDialogButtonBox.StandardButton.Cancel
-        )
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons)
-
-    def selected_projects(self) -> list[str]:
+    def selected_projects(self) -> list[Project]:
         return [
-            name for name, cb in self.checkboxes.items()
-            if cb.isChecked()
+            self._projects[r] for r in range(self.model.rowCount())
+            if self.model.item(r).checkState() == Qt.CheckState.Checked
         ]
+
+
 class AddTaskDialog(QDialog):
     def __init__(self, parent: QWidget | None = None, task: Task | None = None):
         super().__init__(parent)
-        self._task = task
-        self.setWindowTitle("Edit Task" if task else "Add Task")
         self.setModal(True)
 
         layout = QVBoxLayout(self)
@@ -282,7 +567,7 @@ class AddTaskDialog(QDialog):
         layout.addWidget(self.date_edit)
 
         self.no_due_checkbox = QCheckBox("No due date")
-        self.no_due_checkbox.toggled.connect(lambda c: self.date_edit.setEnabled(not c))
+        self.no_due_checkbox.toggled.connect(self.date_edit.setDisabled)
         layout.addWidget(self.no_due_checkbox)
 
         buttons = QDialogButtonBox(
@@ -292,18 +577,25 @@ class AddTaskDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
+        self.reset(task)
+
+    def reset(self, task: Task | None = None):
+        """Load `task` (or blank fields for a new one) so the dialog can be reused."""
+        self._task = task
+        self.setWindowTitle("Edit Task" if task else "Add Task")
         if task:
             self.title_edit.setText(task.title)
-            if task.due_date is None:
-                self.no_due_checkbox.setChecked(True)
-            else:
-                self.date_edit.setDate(QDate(task.due_date.year, task.due_date.month, task.due_date.day))
         else:
-            self.date_edit.setDate(QDate.currentDate())
-
+            self.title_edit.clear()
+        if task and task.due_date is not None:
+            self.date_edit.setDate(QDate(task.due_date.year, task.due_date.month, task.due_date.day))
+        else:
+            self.date_edit.setDate(_today)
+        self.no_due_checkbox.setChecked(bool(task) and task.due_date is None)
         self.title_edit.setFocus()
 
-    def get_task(self) -> Task | None:
+    def get_task(self, task: Task | None = None) -> Task | None:
+        self.reset(task)
         if self.exec() != QDialog.DialogCode.Accepted:
             return None
 
@@ -319,89 +611,130 @@ class AddTaskDialog(QDialog):
 
         if self._task:
             self._task.title = title
-            self._task.due_date = due
+            self._task.set_due_date(due)
             return self._task
 
         return Task(title=title, due_date=due)
 
 
 # ============================================================
-# Task widget
+# Task list (model + delegate)
 # ============================================================
-class TaskWidget(QWidget):
-    changed = pyqtSignal()
-    activated = pyqtSignal()
+class TaskListModel(QAbstractListModel):
+    """
+    One board's view of a project's tasks. Rows are painted by TaskDelegate,
+    so no QWidget is created per task.
+    """
+    DueTextRole = Qt.ItemDataRole.UserRole.value + 1
+    TaskRole = Qt.ItemDataRole.UserRole.value + 2
 
-    def __init__(self, project: Project, task: Task, parent: QWidget | None = None):
+    taskToggled = pyqtSignal(object)  # task
+
+    def __init__(self, project: Project, show_completed: bool, parent: QObject | None = None):
         super().__init__(parent)
         self.project = project
-        self.task = task
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(6, 4, 6, 4)
+        self.show_completed = show_completed
+        self._tasks: list[Task] = []
 
-        self.checkbox = QCheckBox()
-        self.checkbox.setChecked(bool(task.completed))
-        self.checkbox.stateChanged.connect(self._on_checked)
-        layout.addWidget(self.checkbox)
+    def set_tasks(self, tasks: list[Task]):
+        # Project.view hands back the same list object until something changes
+        if tasks is self._tasks:
+            return
+        self.beginResetModel()
+        self._tasks = tasks
+        self.endResetModel()
 
-        self.title_label = QLabel(task.title)
-        layout.addWidget(self.title_label, 1)
+    def task_at(self, index: QModelIndex) -> Task | None:
+        return self._tasks[index.row()] if index.isValid() else None
 
-        due = f"Due: {task.due_date.isoformat()}" if task.due_date else ""
-        self.due_label = QLabel(due)
-        layout.addWidget(self.due_label)
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._tasks)
 
-        self.setObjectName("TaskWidget")
-        self.setStyleSheet("""
-            QWidget#TaskWidget {
-                border: 1px solid rgba(0,0,0,0.15);
-                border-radius: 8px;
-            }
-        """)
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        t = self._tasks[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return t.title
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return (Qt.CheckState.Checked if t.completed else Qt.CheckState.Unchecked).value
+        if role == self.DueTextRole:
+            return f"Due: {t.due_iso}" if t.due_iso else ""
+        if role == Qt.ItemDataRole.ToolTipRole:
+            # long titles are elided in the fixed-width column
+            return f"{t.title}\nDue: {t.due_iso}" if t.due_iso else t.title
+        if role == self.TaskRole:
+            return t
+        return None
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        t = self._tasks[index.row()]
+        t.completed = Qt.CheckState(value) == Qt.CheckState.Checked
+        self.project.invalidate()
+        self.dataChanged.emit(index, index, [role])
+        self.taskToggled.emit(t)
+        return True
+
+
+class TaskListView(QListView):
+    """QListView that reports every press, including on empty space below the rows."""
+    pressedAnywhere = pyqtSignal()
 
     def mousePressEvent(self, e):
-        self.activated.emit()
+        self.pressedAnywhere.emit()
         super().mousePressEvent(e)
 
-    def mouseDoubleClickEvent(self, e):
-        self.activated.emit()
-        dlg = AddTaskDialog(self, self.task)
-        if dlg.get_task():
-            self.changed.emit()
-
-    def _on_checked(self, state: int):
-        self.task.completed = (state == Qt.CheckState.Checked.value)
-        self.changed.emit()
-
-    def contextMenuEvent(self, e):
-        self.activated.emit()
-
-        menu = QMenu(self)
-        act_edit = menu.addAction("Edit Task")
-        act_delete = menu.addAction("Delete Task")
-        act = menu.exec(e.globalPos())
 
-        if act == act_edit:
-            dlg = AddTaskDialog(self, self.task)
-            if dlg.get_task():
-                self.changed.emit()
+class TaskDelegate(QStyledItemDelegate):
+    """Paints a task row (checkbox, title, due date) straight with QPainter."""
+    MARGIN = 6
+
+    def _content_option(self, option: QStyleOptionViewItem, index: QModelIndex) -> QStyleOptionViewItem:
+        # same geometry for painting and for checkbox hit-testing
+        rect = option.rect.adjusted(self.MARGIN, 0, -self.MARGIN, 0)
+        due = index.data(TaskListModel.DueTextRole)
+        if due:
+            # leave room on the right for the due date
+            rect.setRight(rect.right() - option.fontMetrics.horizontalAdvance(due) - self.MARGIN)
+        opt = QStyleOptionViewItem(option)
+        opt.rect = rect
+        return opt
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QColor(0, 0, 0, 38))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRoundedRect(QRectF(option.rect).adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+        painter.restore()
+
+        super().paint(painter, self._content_option(option, index), index)
+
+        due = index.data(TaskListModel.DueTextRole)
+        if due:
+            painter.save()
+            painter.setPen(option.palette.color(QPalette.ColorRole.Text))
+            painter.drawText(
+                option.rect.adjusted(0, 0, -self.MARGIN, 0),
+                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                due,
+            )
+            painter.restore()
 
-        elif act == act_delete:
-            box = QMessageBox(self)
-            box.setWindowTitle("Delete Task")
-            box.setText(f"Delete task '{self.task.title}'?")
-            delete_btn = box.addButton("Delete", QMessageBox.ButtonRole.DestructiveRole)
-            box.addButton(QMessageBox.StandardButton.Cancel)
-            box.exec()
+    def editorEvent(self, event, model, option, index) -> bool:
+        return super().editorEvent(event, model, self._content_option(option, index), index)
 
-            if box.clickedButton() == delete_btn:
-                # actually remove from project
-                try:
-                    self.project.tasks.remove(self.task)
-                except ValueError:
-                    pass
-                self.changed.emit()
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        size = super().sizeHint(option, index)
+        size.setHeight(size.height() + 2 * self.MARGIN)
+        return size
 
 
 # ============================================================
@@ -409,6 +742,8 @@ class TaskWidget(QWidget):
 # ============================================================
 class ProjectColumn(QFrame):
     requestAddTask = pyqtSignal(str)
+    editTaskRequested = pyqtSignal(object, object)  # project, task
+    taskToggled = pyqtSignal(object, object)  # project, task
     changed = pyqtSignal()
     activated = pyqtSignal(str)
     deleteRequested = pyqtSignal(str)
@@ -421,82 +756,133 @@ class ProjectColumn(QFrame):
 
         self.setObjectName("ProjectCard")
         self.setProperty("active", False)
-        self.setStyleSheet("""
-            QFrame#ProjectCard {
-                background-color: palette(window);
-                border: 1px solid palette(mid);
-                border-radius: 12px;
-                padding: 6px;
-            }
-            QFrame#ProjectCard:hover {
-                border-color: palette(highlight);
-            }
-            QFrame#ProjectCard[active="true"] {
-                background-color: palette(base);
-                border: 2px solid palette(highlight);
-            }
-        """)
-
-        self.installEventFilter(self)
 
         outer = QVBoxLayout(self)
 
         header = QHBoxLayout()
         self.name_label = QLabel(f"<b>{project.name}</b>")
+        # let presses fall through to the card (mousePressEvent below)
+        self.name_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         header.addWidget(self.name_label)
         header.addStretch()
 
         self.add_btn = None
         if not show_completed:
             self.add_btn = QPushButton("Add Task")
-            self.add_btn.clicked.connect(lambda: self.requestAddTask.emit(project.name))
+            self.add_btn.clicked.connect(self._on_add_clicked)
             header.addWidget(self.add_btn)
-            self.add_btn.installEventFilter(self)
 
         outer.addLayout(header)
 
-        self.tasks_layout = QVBoxLayout()
-        outer.addLayout(self.tasks_layout)
-        outer.addStretch()
-
-        self.name_label.installEventFilter(self)
+        self.model = TaskListModel(project, show_completed, self)
+        self.model.taskToggled.connect(self._on_task_toggled)
+
+        self.task_list = TaskListView()
+        self.task_list.setObjectName("TaskList")
+        self.task_list.setModel(self.model)
+        self.task_list.setItemDelegate(TaskDelegate(self.task_list))
+        self.task_list.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.task_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.task_list.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.task_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.task_list.setSpacing(3)
+        # rows are single-line, so the view can size one and skip measuring the rest
+        self.task_list.setUniformItemSizes(True)
+        self.task_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.task_list.customContextMenuRequested.connect(self._task_context_menu)
+        self.task_list.doubleClicked.connect(self._on_task_double_clicked)
+        self.task_list.pressedAnywhere.connect(self._on_pressed)
+        outer.addWidget(self.task_list, 1)
 
         self.populate()
 
-    def eventFilter(self, obj, event):
-        if event.type() == QEvent.Type.MouseButtonPress:
-            self.activated.emit(self.project.name)
-        return super().eventFilter(obj, event)
+    def mousePressEvent(self, e):
+        self.activated.emit(self.project.name)
+        super().mousePressEvent(e)
+
+    @pyqtSlot()
+    def _on_pressed(self):
+        self.activated.emit(self.project.name)
 
     def set_active(self, active: bool):
-        self.setProperty("active", bool(active))
+        active = bool(active)
+        # re-polishing re-runs the stylesheet; skip it when nothing changed
+        if self.property("active") == active:
+            return
+        self.setProperty("active", active)
         self.style().unpolish(self)
         self.style().polish(self)
         self.update()
 
     def populate(self):
-        while self.tasks_layout.count():
-            w = self.tasks_layout.takeAt(0).widget()
-            if w:
-                w.deleteLater()
+        self.name_label.setText(f"<b>{self.project.name}</b>")
+        self.model.set_tasks(self.project.view(self.show_completed))
+
+    def discard(self):
+        # cut connections first so nothing is delivered while deletion is pending
+        for sig in (self.requestAddTask, self.editTaskRequested, self.taskToggled,
+                    self.changed, self.activated, self.deleteRequested, self.renamed):
+            sig.disconnect()
+        self.deleteLater()
+
+    @pyqtSlot()
+    def _on_add_clicked(self):
+        self.activated.emit(self.project.name)
+        self.requestAddTask.emit(self.project.name)
+
+    @pyqtSlot(object)
+    def _on_task_toggled(self, task: Task):
+        self.taskToggled.emit(self.project, task)
+
+    @pyqtSlot(QModelIndex)
+    def _on_task_double_clicked(self, index: QModelIndex):
+        task = self.model.task_at(index)
+        if task is not None:
+            self.editTaskRequested.emit(self.project, task)
+
+    @pyqtSlot(QPoint)
+    def _task_context_menu(self, pos):
+        self.activated.emit(self.project.name)
+        global_pos = self.task_list.viewport().mapToGlobal(pos)
+        task = self.model.task_at(self.task_list.indexAt(pos))
+        if task is None:
+            self._project_context_menu(global_pos)
+            return
 
-        tasks = [t for t in self.project.tasks if t.completed == self.show_completed]
+        menu = QMenu(self)
+        act_edit = menu.addAction("Edit Task")
+        act_delete = menu.addAction("Delete Task")
+        act = menu.exec(global_pos)
 
-        def sort_key(t: Task):
-            return (t.due_date is None, t.due_date or date.max)
+        if act == act_edit:
+            self.editTaskRequested.emit(self.project, task)
 
-        for task in sorted(tasks, key=sort_key):
-            w = TaskWidget(self.project, task)
-            w.changed.connect(self.changed.emit)
-            w.activated.connect(lambda p=self.project.name: self.activated.emit(p))
-            w.installEventFilter(self)
-            self.tasks_layout.addWidget(w)
+        elif act == act_delete:
+            box = QMessageBox(self)
+            box.setWindowTitle("Delete Task")
+            box.setText(f"Delete task '{task.title}'?")
+            delete_btn = box.addButton("Delete", QMessageBox.ButtonRole.DestructiveRole)
+            box.addButton(QMessageBox.StandardButton.Cancel)
+            box.exec()
+
+            if box.clickedButton() == delete_btn:
+                # actually remove from project
+                try:
+                    self.project.tasks.remove(task)
+                except ValueError:
+                    pass
+                self.project.invalidate()
+                self.populate()
+                self.changed.emit()
 
     def contextMenuEvent(self, e):
+        self._project_context_menu(e.globalPos())
+
+    def _project_context_menu(self, global_pos):
         menu = QMenu(self)
         act_rename = menu.addAction("Rename Project")
         act_delete = menu.addAction("Delete Project")
-        act = menu.exec(e.globalPos())
+        act = menu.exec(global_pos)
 
         if act == act_rename:
             old = self.project.name
@@ -523,6 +909,8 @@ class ProjectColumn(QFrame):
 # ============================================================
 class ProjectBoard(QWidget):
     requestAddTask = pyqtSignal(str)
+    editTaskRequested = pyqtSignal(object, object)  # project, task
+    taskToggled = pyqtSignal(object, object)  # project, task
     changed = pyqtSignal()
     projectActivated = pyqtSignal(str)
     projectDeleteRequested = pyqtSignal(str)
@@ -533,6 +921,8 @@ class ProjectBoard(QWidget):
         self.show_completed = show_completed
         self._active_project_name: str | None = None
         self._columns: list[ProjectColumn] = []
+        # keyed by id(project) so a rename keeps its column
+        self._column_for_project: dict[int, ProjectColumn] = {}
 
         root = QVBoxLayout(self)
         root.addWidget(QLabel("<h2>Completed Tasks</h2>" if show_completed else "<h2>Active Tasks</h2>"))
@@ -553,26 +943,50 @@ class ProjectBoard(QWidget):
         for col in self._columns:
             col.set_active(bool(name) and col.project.name == name)
 
-    def populate(self, projects: list[Project]):
-        while self.hbox.count() > 1:
-            item = self.hbox.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
-
-        self._columns = []
-        for p in projects:
-            col = ProjectColumn(p, self.show_completed)
-            col.requestAddTask.connect(self.requestAddTask.emit)
-            col.changed.connect(self.changed.emit)
-            col.activated.connect(self.projectActivated.emit)
-            col.deleteRequested.connect(self.projectDeleteRequested.emit)
-            col.renamed.connect(self.projectRenamed.emit)
-
-            self._columns.append(col)
-            self.hbox.insertWidget(self.hbox.count() - 1, col)
-
-        self.set_active_project(self._active_project_name)
+    def refresh(self, projects: list[Project]):
+        """
+        Bring the columns in line with `projects`, reusing the column of every
+        project that is still present instead of rebuilding the whole board.
+        """
+        # one repaint for the whole board instead of one per column change
+        self.setUpdatesEnabled(False)
+        try:
+            wanted = {id(p) for p in projects}
+            for key in [k for k in self._column_for_project if k not in wanted]:
+                col = self._column_for_project.pop(key)
+                self.hbox.removeWidget(col)
+                col.discard()
+
+            self._columns = []
+            for i, p in enumerate(projects):
+                col = self._column_for_project.get(id(p))
+                if col is None:
+                    col = ProjectColumn(p, self.show_completed)
+                    col.requestAddTask.connect(self.requestAddTask.emit)
+                    col.editTaskRequested.connect(self.editTaskRequested.emit)
+                    col.taskToggled.connect(self.taskToggled.emit)
+                    col.changed.connect(self.changed.emit)
+                    col.activated.connect(self.projectActivated.emit)
+                    col.deleteRequested.connect(self.projectDeleteRequested.emit)
+                    col.renamed.connect(self.projectRenamed.emit)
+                    self._column_for_project[id(p)] = col
+                    self.hbox.insertWidget(i, col)
+                else:
+                    col.populate()
+                    if self.hbox.indexOf(col) != i:
+                        self.hbox.removeWidget(col)
+                        self.hbox.insertWidget(i, col)
+                self._columns.append(col)
+
+            self.set_active_project(self._active_project_name)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def refresh_project(self, project: Project):
+        """Repopulate only the column showing `project`, if there is one."""
+        col = self._column_for_project.get(id(project))
+        if col is not None:
+            col.populate()
 
 
 # ============================================================
@@ -585,9 +999,47 @@ class MainWindow(QMainWindow):
         self.resize(1100, 650)
 
         self.cfg = load_config()
+        # most-recent-first; stored on disk as a plain list
+        self._recent = OrderedDict.fromkeys(self.cfg.get("recent", []))
+        self._config_dirty = False
         self.state = AppState()
         self.data_file: Path | None = None
         self.active_project_name: str | None = None
+        self._task_dialog: AddTaskDialog | None = None
+        self._pdf_doc: QTextDocument | None = None
+
+        # saves are coalesced: bursts of edits collapse into one write
+        self._save_pending = False
+        self._last_saved_hash: int | None = None
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._flush_save)
+        self._save_signals = _SaveSignals(self)
+        self._save_signals.failed.connect(self._on_save_failed)
+
+        # change signals are coalesced too: a burst of toggles rebuilds once
+        self._rebuild_timer = QTimer(self)
+        self._rebuild_timer.setSingleShot(True)
+        self._rebuild_timer.setInterval(50)
+        self._rebuild_timer.timeout.connect(self._do_save_and_rebuild)
+
+        # conflict copies are picked up by watching the project folder;
+        # bursts of directory events (our own saves included) share one scan
+        self._known_conflicts: set[Path] = set()
+        self._watcher = QFileSystemWatcher(self)
+        self._conflict_timer = QTimer(self)
+        self._conflict_timer.setSingleShot(True)
+        self._conflict_timer.setInterval(500)
+        self._conflict_timer.timeout.connect(self._scan_conflicts)
+        self._watcher.directoryChanged.connect(self._on_folder_changed)
+        # scans get their own pool so waiting on saves never waits on a slow
+        # folder listing; created before the signals object so it is torn
+        # down (and drained) first
+        self._scan_pool = QThreadPool(self)
+        self._scan_pool.setMaxThreadCount(1)
+        self._conflict_signals = _ConflictSignals(self)
+        self._conflict_signals.found.connect(self._on_conflicts_found)
 
         self.stack = QStackedWidget()
         self.setCentralWidget(self.stack)
@@ -599,11 +1051,15 @@ class MainWindow(QMainWindow):
 
         # wiring
         self.active.requestAddTask.connect(self.add_task_to_project)
+        self.active.editTaskRequested.connect(self.edit_task)
+        self.active.taskToggled.connect(self.on_task_toggled)
         self.active.changed.connect(self.save_and_rebuild)
         self.active.projectActivated.connect(self.set_active_project)
         self.active.projectDeleteRequested.connect(self.delete_project_by_name)
         self.active.projectRenamed.connect(self.on_project_renamed)
 
+        self.completed.editTaskRequested.connect(self.edit_task)
+        self.completed.taskToggled.connect(self.on_task_toggled)
         self.completed.changed.connect(self.save_and_rebuild)
         self.completed.projectActivated.connect(self.set_active_project)
         self.completed.projectDeleteRequested.connect(self.delete_project_by_name)
@@ -624,24 +1080,41 @@ class MainWindow(QMainWindow):
         status.setSizeGripEnabled(False)
 
         self.quote_label = QLabel()
+        self.quote_label.setObjectName("QuoteLabel")
         self.quote_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        # palette(windowText) is white in dark mode, dark in light mode
-        self.quote_label.setStyleSheet("""
-            QLabel {
-                color: palette(windowText);
-                font-style: italic;
-                padding: 4px;
-            }
-        """)
         status.addPermanentWidget(self.quote_label, 1)
 
         self.set_random_quote()
         self.quote_timer = QTimer(self)
         self.quote_timer.timeout.connect(self.set_random_quote)
+        self.quote_timer.timeout.connect(refresh_today)
         self.quote_timer.start(60_000)
 
+    @pyqtSlot()
     def set_random_quote(self):
-        self.quote_label.setText(random.choice(QUOTES))
+        self.quote_label.setText(next(_quote_iter))
+
+    def _update_quote_timer(self):
+        # no point waking up every minute while nobody can see the quote
+        if self.isVisible() and not self.isMinimized():
+            if not self.quote_timer.isActive():
+                refresh_today()
+                self.quote_timer.start(60_000)
+        else:
+            self.quote_timer.stop()
+
+    def changeEvent(self, e):
+        if e.type() == QEvent.Type.WindowStateChange:
+            self._update_quote_timer()
+        super().changeEvent(e)
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        self._update_quote_timer()
+
+    def hideEvent(self, e):
+        super().hideEvent(e)
+        self._update_quote_timer()
 
     # --------------------------------------------------------
     # Menu
@@ -670,16 +1143,17 @@ class MainWindow(QMainWindow):
         # Recent files submenu
         self.recent_menu = proj.addMenu("Recent Files")
         self.recent_menu.aboutToShow.connect(self.populate_recent_menu)
+        self.recent_menu.triggered.connect(self._open_recent)
 
         view = bar.addMenu("View")
 
         act_view_active = view.addAction("Active Tasks")
         act_view_active.setShortcut(QKeySequence("Ctrl+1"))
-        act_view_active.triggered.connect(lambda: self.stack.setCurrentWidget(self.active))
+        act_view_active.triggered.connect(self.show_active_board)
 
         act_view_completed = view.addAction("Completed Tasks")
         act_view_completed.setShortcut(QKeySequence("Ctrl+2"))
-        act_view_completed.triggered.connect(lambda: self.stack.setCurrentWidget(self.completed))
+        act_view_completed.triggered.connect(self.show_completed_board)
 
         proj.addSeparator()
 
@@ -688,9 +1162,10 @@ class MainWindow(QMainWindow):
         act_export.setShortcut(QKeySequence("Ctrl+P"))
         act_export.triggered.connect(self.export_todo_list_pdf)
 
+    @pyqtSlot()
     def populate_recent_menu(self):
         self.recent_menu.clear()
-        rec = self.cfg.get("recent", [])
+        rec = self._recent
         if not rec:
             a = self.recent_menu.addAction("(No recent files)")
             a.setEnabled(False)
@@ -699,7 +1174,21 @@ class MainWindow(QMainWindow):
         for p in rec:
             pp = Path(p)
             a = self.recent_menu.addAction(pp.name)
-            a.triggered.connect(lambda _, x=p: self.load_project_file(Path(x), rebuild=True))
+            a.setData(p)
+
+    @pyqtSlot(QAction)
+    def _open_recent(self, action: QAction):
+        p = action.data()
+        if p:
+            self.load_project_file(Path(p), rebuild=True)
+
+    @pyqtSlot()
+    def show_active_board(self):
+        self.stack.setCurrentWidget(self.active)
+
+    @pyqtSlot()
+    def show_completed_board(self):
+        self.stack.setCurrentWidget(self.completed)
 
     # --------------------------------------------------------
     # Startup / file handling
@@ -730,48 +1219,75 @@ class MainWindow(QMainWindow):
         self.load_project_file(p, rebuild=False)
 
     def load_project_file(self, path: Path, rebuild: bool = True):
+        # don't lose edits still waiting to be written to the previous file
+        self._flush_save()
+        QThreadPool.globalInstance().waitForDone()
+        self._scan_pool.clear()
         self.data_file = resolve_user_path(path)
-
-        # update config + recents
-        recent = self.cfg.get("recent", [])
-        recent = [str(self.data_file)] + [x for x in recent if x != str(self.data_file)]
-        self.cfg["recent"] = recent[:MAX_RECENT]
-        self.cfg["data_file"] = str(self.data_file)
-        save_config(self.cfg)
+        self._last_saved_hash = None
+
+        # update config + recents; written by the debounced save
+        key = str(self.data_file)
+        self._recent[key] = None
+        self._recent.move_to_end(key, last=False)
+        while len(self._recent) > MAX_RECENT:
+            self._recent.popitem(last=True)
+        self.cfg["data_file"] = key
+        self._config_dirty = True
+        self._save_timer.start()
 
         # load/create
         try:
             if self.data_file.exists():
-                data = json.loads(self.data_file.read_text(encoding="utf-8"))
+                data = loads_json(self.data_file.read_bytes())
                 self.state = deserialize_state(data)
             else:
                 self.state = AppState()
-                self.data_file.write_text(json.dumps(serialize_state(self.state), indent=2), encoding="utf-8")
+                write_atomic(self.data_file, dumps_json(serialize_state(self.state)))
         except Exception as e:
             QMessageBox.critical(self, "Project File Error", f"Could not load:\n\n{e}")
             self.state = AppState()
 
-        # warn conflicts
-        self.detect_conflicts()
+        self._watch_project_folder()
 
         if rebuild:
             self.active_project_name = self.state.projects[0].name if self.state.projects else None
             self.rebuild()
 
-    def detect_conflicts(self):
-        if not self.data_file:
+    def _watch_project_folder(self):
+        dirs = self._watcher.directories()
+        if dirs:
+            self._watcher.removePaths(dirs)
+        self._known_conflicts = set()
+        self._watcher.addPath(str(self.data_file.parent))
+        self._scan_conflicts()
+
+    @pyqtSlot(str)
+    def _on_folder_changed(self, path: str):
+        self._conflict_timer.start()
+
+    @pyqtSlot()
+    def _scan_conflicts(self):
+        if self.data_file:
+            self._scan_pool.start(_ConflictScanJob(self.data_file, self._conflict_signals))
+
+    @pyqtSlot(object, list)
+    def _on_conflicts_found(self, basefile: Path, hits: list[Path]):
+        # result of a scan for a file we have since switched away from
+        if basefile != self.data_file:
             return
-        folder = self.data_file.parent
-        hits = conflict_candidates(folder, self.data_file)
-        if hits:
+        new = [p for p in hits if p not in self._known_conflicts]
+        self._known_conflicts = set(hits)
+        if new:
             QMessageBox.warning(
                 self,
                 "Sync conflict detected",
                 "A conflicting file was found (cloud sync duplicate). "
                 "Please pick the correct one from Project → Change Project File…\n\n"
-                f"Example:\n{hits[0].name}"
+                f"Example:\n{new[0].name}"
             )
 
+    @pyqtSlot()
     def change_project_file(self):
         p = choose_existing_file(self)
         if p:
@@ -783,24 +1299,69 @@ class MainWindow(QMainWindow):
     def save_state(self):
         if not self.data_file:
             return
-        try:
-            self.data_file.write_text(json.dumps(serialize_state(self.state), indent=2), encoding="utf-8")
-        except Exception:
-            QMessageBox.warning(
-                self,
-                "Read-only / locked",
-                "Could not save the project file.\n\n"
-                "This can happen if the file is read-only, locked by sync software, or you opened a conflict copy.\n"
-                "Try a different location via Project → Change Project File…"
-            )
+        # serialize here so the worker never touches live state
+        payload = dumps_json(serialize_state(self.state))
+        # many paths schedule a save without changing anything; skip those
+        h = hash(payload)
+        if h == self._last_saved_hash:
+            return
+        self._last_saved_hash = h
+        QThreadPool.globalInstance().start(_SaveJob(self.data_file, payload, self._save_signals))
+
+    @pyqtSlot()
+    def _on_save_failed(self):
+        # the file on disk no longer matches what we last sent; retry next time
+        self._last_saved_hash = None
+        QMessageBox.warning(
+            self,
+            "Read-only / locked",
+            "Could not save the project file.\n\n"
+            "This can happen if the file is read-only, locked by sync software, or you opened a conflict copy.\n"
+            "Try a different location via Project → Change Project File…"
+        )
 
+    @pyqtSlot()
+    def _flush_save(self):
+        if self._rebuild_timer.isActive():
+            # a change is still waiting on the rebuild coalescer: run it now
+            # so neither its save nor its rebuild is lost
+            self._rebuild_timer.stop()
+            self._do_save_and_rebuild()
+        self._save_timer.stop()
+        if self._save_pending:
+            self._save_pending = False
+            self.save_state()
+        if self._config_dirty:
+            self._config_dirty = False
+            self.cfg["recent"] = list(self._recent)
+            try:
+                save_config(self.cfg)
+            except OSError:
+                # recents are a convenience; never let them cost a project save
+                pass
+
+    @pyqtSlot(object, object)
+    def on_task_toggled(self, project: Project, task: Task):
+        # a toggle only moves one task between the two boards; touch just
+        # that project's columns instead of rebuilding everything
+        self.active.refresh_project(project)
+        self.completed.refresh_project(project)
+        self._save_pending = True
+        self._save_timer.start()
+
+    @pyqtSlot()
     def save_and_rebuild(self):
-        self.save_state()
+        self._rebuild_timer.start()
+
+    @pyqtSlot()
+    def _do_save_and_rebuild(self):
+        self._save_pending = True
+        self._save_timer.start()
         self.rebuild()
 
     def rebuild(self):
-        self.active.populate(self.state.projects)
-        self.completed.populate(self.state.projects)
+        self.active.refresh(self.state.projects)
+        self.completed.refresh(self.state.projects)
 
         # keep highlight consistent
         if self.active_project_name:
@@ -810,6 +1371,7 @@ class MainWindow(QMainWindow):
     # --------------------------------------------------------
     # Selection / active project
     # --------------------------------------------------------
+    @pyqtSlot(str)
     def set_active_project(self, name: str):
         self.active_project_name = name
         self.active.set_active_project(name)
@@ -817,50 +1379,64 @@ class MainWindow(QMainWindow):
 
     def get_target_project(self) -> Project | None:
         if self.active_project_name:
-            for p in self.state.projects:
-                if p.name == self.active_project_name:
-                    return p
+            p = self.state.by_name.get(self.active_project_name)
+            if p:
+                return p
         return self.state.projects[0] if self.state.projects else None
 
     # --------------------------------------------------------
     # Actions
     # --------------------------------------------------------
+    @pyqtSlot()
     def add_project(self):
         name, ok = QInputDialog.getText(self, "Add Project", "Project name:")
         if ok and name.strip():
-            self.state.projects.append(Project(name.strip()))
+            if name.strip() in self.state.by_name:
+                QMessageBox.information(self, "Duplicate name", f"A project named '{name.strip()}' already exists.")
+                return
+            self.state.add_project(Project(name.strip()))
             if not self.active_project_name:
                 self.active_project_name = name.strip()
             self.save_and_rebuild()
 
+    @pyqtSlot()
     def add_task_shortcut(self):
         p = self.get_target_project()
         if not p:
             QMessageBox.information(self, "No project", "Create a project first.")
             return
-        dlg = AddTaskDialog(self)
-        t = dlg.get_task()
+        t = self.task_dialog().get_task()
         if t:
             p.tasks.append(t)
+            p.invalidate()
             self.save_and_rebuild()
 
+    @pyqtSlot(str)
     def add_task_to_project(self, project_name: str):
-        p = next((x for x in self.state.projects if x.name == project_name), None)
+        p = self.state.by_name.get(project_name)
         if not p:
             return
-        dlg = AddTaskDialog(self)
-        t = dlg.get_task()
+        t = self.task_dialog().get_task()
         if t:
             p.tasks.append(t)
+            p.invalidate()
             self.save_and_rebuild()
 
+    def task_dialog(self) -> AddTaskDialog:
+        # one dialog per window, reset on each use (the calendar popup is costly to build)
+        if self._task_dialog is None:
+            self._task_dialog = AddTaskDialog(self)
+        return self._task_dialog
+
+    @pyqtSlot(object, object)
+    def edit_task(self, project: Project, task: Task):
+        if self.task_dialog().get_task(task):
+            project.invalidate()
+            self.save_and_rebuild()
+
+    @pyqtSlot(str)
     def delete_project_by_name(self, project_name: str):
-        p = next((x for x in self.state.projects if x.name == project_name), None)
-        if not p:
-            return
-        try:
-            self.state.projects.remove(p)
-        except ValueError:
+        if not self.state.remove_project(project_name):
             return
 
         if self.active_project_name == project_name:
@@ -868,13 +1444,27 @@ class MainWindow(QMainWindow):
 
         self.save_and_rebuild()
 
+    @pyqtSlot(str, str)
     def on_project_renamed(self, old: str, new: str):
+        p = self.state.by_name.get(old)
+        if p is None:
+            return
+        clash = self.state.by_name.get(new)
+        if clash is not None and clash is not p:
+            # the column already applied the new name; undo it
+            p.name = old
+            QMessageBox.information(self, "Duplicate name", f"A project named '{new}' already exists.")
+            self.rebuild()
+            return
+        self.state.rename_project(old, new)
+
         # keep highlight and active selection stable after rename
         if self.active_project_name == old:
             self.active_project_name = new
         # also rebuild highlight without forcing a different project
         self.save_and_rebuild()
 
+    @pyqtSlot()
     def export_todo_list_pdf(self):
         if not self.state.projects:
             QMessageBox.information(self, "No projects", "There are no projects to export.")
@@ -898,49 +1488,24 @@ class MainWindow(QMainWindow):
         if not path:
             return
 
-        html = """
-        <html>
-        <head>
-            <style>
-                body {
-                    font-family: Helvetica, Arial, sans-serif;
-                    font-size: 11pt;
-                }
-                h1 {
-                    font-size: 14pt;
-                    margin-bottom: 10px;
-                }
-                h2 {
-                    font-size: 12pt;
-                    margin-top: 18px;
-                    margin-bottom: 6px;
-                }
-                ul {
-                    list-style-type: none;
-                    padding-left: 0;
-                    margin-left: 0;
-                }
-                li {
-                    margin-bottom: 6px;
-                }
-            </style>
-        </head>
-        <body>
-            <h1>To-Do List</h1>
-        """
+        parts = ["<html><body><h1>To-Do List</h1>"]
 
+        # collect fragments and join once: repeated str += is quadratic
         for p in projects:
-            html += f"<h2>{p.name}</h2><ul>"
-            for t in p.tasks:
-                if not t.completed:
-                    due = f" — due {t.due_date.isoformat()}" if t.due_date else ""
-                    html += f"<li>☐ {t.title}{due}</li>"
-            html += "</ul>"
+            parts.append(f"<h2>{escape(p.name)}</h2><ul>")
+            for t in p.view(False):
+                due = f" — due {t.due_iso}" if t.due_iso else ""
+                parts.append(f"<li>☐ {escape(t.title)}{due}</li>")
+            parts.append("</ul>")
 
-        html += "</body></html>"
+        parts.append("</body></html>")
 
-        doc = QTextDocument()
-        doc.setHtml(html)
+        # reuse one document so the stylesheet is parsed only once
+        if self._pdf_doc is None:
+            self._pdf_doc = QTextDocument(self)
+            self._pdf_doc.setDefaultStyleSheet(_PDF_CSS)
+        doc = self._pdf_doc
+        doc.setHtml("".join(parts))
 
         printer = QPrinter(QPrinter.PrinterMode.HighResolution)
         printer.setOutputFormat(QPrinter.OutputFormat.PdfFormat)
@@ -948,6 +1513,12 @@ class MainWindow(QMainWindow):
 
         doc.print(printer)
 
+    def closeEvent(self, e):
+        self._scan_pool.clear()
+        self._flush_save()
+        QThreadPool.globalInstance().waitForDone()
+        super().closeEvent(e)
+
 # ============================================================
 # Entry
 # ============================================================
@@ -957,6 +1528,7 @@ def main():
     QApplication.setOrganizationName("ThesisTracker")
 
     app = QApplication(sys.argv)
+    app.setStyleSheet(_PROJECT_CARD_QSS + _TASK_LIST_QSS + _QUOTE_QSS)
     w = MainWindow()
     w.show()
     sys.exit(app.exec())